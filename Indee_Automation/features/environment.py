@@ -1,9 +1,46 @@
+import logging
+import os
+import socket
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 
+from pages.base_page import BasePage
+from utils.browser_trace import BrowserTracer, chrome_trace_options
+from utils.command_trace import CommandRecorder, replay_driver
+from utils.perf_baseline import PerfBaseline, scenario_timings
+from utils.result_sink import JsonlLogHandler, RotatingJsonlSink
+
 def before_all(context):
     """Runs once before the entire test suite."""
+    userdata = context.config.userdata
+    context.recorder = None
+    context.result_sink = context.log_sink = None
+
+    # Streaming sinks: scenario results, step timings and page logs go to rotating
+    # gzip JSONL files instead of stdout/stderr (behave -D results_dir=<dir> [-D worker=<id>])
+    if userdata.get("results_dir"):
+        worker = userdata.get("worker", f"{socket.gethostname()}-{os.getpid()}")
+        context.result_sink = RotatingJsonlSink(userdata["results_dir"], f"results-{worker}", worker=worker)
+        context.log_sink = RotatingJsonlSink(userdata["results_dir"], f"logs-{worker}", worker=worker)
+        BasePage.extra_log_handlers = [JsonlLogHandler(context.log_sink)]
+        BasePage.stderr_log_level = logging.WARNING  # keep CI logs to warnings and errors
+        for name in ("BrowserTracer", "CommandTrace", "PerfBaseline", "ResultSink"):
+            BasePage.configure_logger(name)
+
+    # Performance regression gate: compare step timings to history (behave -D perf_baseline=<baseline.json>)
+    context.perf_baseline = PerfBaseline(userdata["perf_baseline"]) if userdata.get("perf_baseline") else None
+
+    # Replay mode: serve WebDriver commands from a recorded trace (behave -D replay=<trace.jsonl>)
+    if userdata.get("replay"):
+        context.driver, context.replay_executor = replay_driver(
+            userdata["replay"], speed=userdata.getfloat("replay_speed", 0.0),
+            strict=userdata.getbool("replay_strict", False)
+        )
+        print(f"\n📼 Replaying WebDriver commands from {userdata['replay']}")
+        return
+
     # chrome options
     chrome_options = Options()
     chrome_options.add_argument("--start-maximized")
@@ -14,6 +51,8 @@ def before_all(context):
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
     chrome_options.add_experimental_option("prefs", {"profile.default_content_setting_values.notifications": 2})
+    if userdata.get("browser_trace"):
+        chrome_trace_options(chrome_options)
 
     # Initialize browser instance
     service = Service("./drivers/chromedriver.exe")
@@ -22,20 +61,69 @@ def before_all(context):
     context.driver.implicitly_wait(10)
     print("\n🚀 Browser launched successfully")
 
+    # Record mode: write every WebDriver command to a trace (behave -D trace=<trace.jsonl>)
+    if userdata.get("trace"):
+        context.recorder = CommandRecorder(context.driver, userdata["trace"])
+        context.recorder.attach()
+
+    # Browser tracing: Chrome timeline + Performance metrics around @traced page-object methods
+    # (behave -D browser_trace=<dir> [-D browser_trace_actions=VideoPage.change_resolution,...])
+    if userdata.get("browser_trace"):
+        actions = [a.strip() for a in userdata.get("browser_trace_actions", "").split(",") if a.strip()]
+        BasePage.tracer = BrowserTracer(context.driver, userdata["browser_trace"], actions=actions or None)
+
 def before_scenario(context, scenario):
     """Runs before each scenario."""
-    print(f"\n🎯 Starting Scenario: {scenario.name}")
+    if not context.result_sink:
+        print(f"\n🎯 Starting Scenario: {scenario.name}")
+
+def before_step(context, step):
+    """Runs before each step."""
+    if BasePage.tracer:
+        BasePage.tracer.step_name = step.name
+
+def after_step(context, step):
+    """Runs after each step."""
+    if context.result_sink:
+        context.result_sink.write({
+            "type": "step", "scenario": context.scenario.name, "step": f"{step.keyword} {step.name}",
+            "status": getattr(step.status, "name", str(step.status)), "duration": step.duration
+        })
 
 def after_scenario(context, scenario):
     """Runs after each scenario."""
+    if context.result_sink:
+        context.result_sink.write({
+            "type": "scenario", "feature": scenario.feature.name, "scenario": scenario.name,
+            "status": getattr(scenario.status, "name", str(scenario.status)), "duration": scenario.duration
+        })
     if scenario.status == "failed":
-        # Optional: Take screenshot on failure
-        context.driver.save_screenshot(f"screenshots/{scenario.name}.png")
-        print(f"❌ Scenario failed: {scenario.name}")
+        # Optional: Take screenshot on failure (the browser may already be gone)
+        try:
+            context.driver.save_screenshot(f"screenshots/{scenario.name}.png")
+        except Exception as e:
+            print(f"⚠️ Could not take screenshot: {e}")
+        if not context.result_sink:
+            print(f"❌ Scenario failed: {scenario.name}")
     else:
-        print(f"✅ Scenario passed: {scenario.name}")
+        if not context.result_sink:
+            print(f"✅ Scenario passed: {scenario.name}")
+
+        # Extend the baseline with timings from passing @perf runs only (behave -D perf_update=true)
+        if (context.perf_baseline and "perf" in scenario.effective_tags
+                and context.config.userdata.getbool("perf_update", False)):
+            context.perf_baseline.add(scenario_timings(context))
+            context.perf_baseline.save()
 
 def after_all(context):
     """Runs once after all tests are done."""
-    context.driver.quit()
+    try:
+        context.driver.quit()
+    finally:
+        # Always flush traces and result streams, even if the session is already dead
+        if context.recorder:
+            context.recorder.detach()
+        for sink in (context.result_sink, context.log_sink):
+            if sink:
+                sink.close()
     print("\n🧹 Browser closed. Test run complete.")
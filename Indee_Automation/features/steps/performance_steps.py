@@ -0,0 +1,35 @@
+from behave import then
+
+from utils.perf_baseline import scenario_timings
+
+
+def _assert_within(context, metric, seconds):
+    """Assert that every recorded sample of a metric is within the budget."""
+    samples = scenario_timings(context).get(metric)
+    assert samples, f"No '{metric}' timing was recorded in this scenario"
+    slowest = max(samples)
+    assert slowest <= seconds, f"{metric} took {slowest:.2f}s, budget is {seconds:g}s"
+
+
+@then("sign in completes within {seconds:g} seconds")
+def step_sign_in_budget(context, seconds):
+    _assert_within(context, "sign_in", seconds)
+
+
+@then("the video starts within {seconds:g} seconds")
+def step_video_start_budget(context, seconds):
+    _assert_within(context, "video_start", seconds)
+
+
+@then("the resolution switch completes within {seconds:g} seconds")
+def step_resolution_switch_budget(context, seconds):
+    _assert_within(context, "resolution_switch", seconds)
+
+
+@then("no performance regressions are detected")
+def step_no_regressions(context):
+    if context.perf_baseline is None:
+        print("ℹ️ No performance baseline configured (-D perf_baseline=<file>), skipping regression gate.")
+        return
+    regressions = context.perf_baseline.check_all(scenario_timings(context))
+    assert not regressions, "Performance regressions detected:\n" + "\n".join(regressions)
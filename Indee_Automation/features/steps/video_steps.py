@@ -25,6 +25,11 @@ def step_navigate_project(context):
     context.home_page.open_project()
 
 
+@when('I navigate to the title "{name}"')
+def step_navigate_title(context, name):
+    context.home_page.open_title(name)
+
+
 @when('I switch to the "Details" tab')
 def step_details(context):
     context.video_page.verify_video_page_loaded()
@@ -67,5 +72,4 @@ def step_logout(context):
     context.video_page.logout()
     time.sleep(5)
     assert context.login_page.verify_signin_page_displayed() == True
-    context.driver.quit()
 
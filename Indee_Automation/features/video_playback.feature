@@ -12,3 +12,19 @@ Feature: Automate Indee video platform
     And I change the video resolution to 480p and back to 720p
     And I pause the video and exit to the main screen
     Then I log out successfully
+
+  @perf
+  Scenario: Video playback meets performance budgets
+    Given I open the Indee video platform
+    When I log in using the provided PIN
+    And I navigate to "Test Automation Project"
+    And I switch to the "Details" tab
+    And I return to the "Videos" tab
+    And I play the video for 10 seconds and pause it
+    And I change the video resolution to 480p and back to 720p
+    Then sign in completes within 5 seconds
+    And the video starts within 2 seconds
+    And the resolution switch completes within 3 seconds
+    And no performance regressions are detected
+    When I pause the video and exit to the main screen
+    Then I log out successfully
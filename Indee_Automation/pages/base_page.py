@@ -1,5 +1,6 @@
+import functools
 import logging
-from typing import Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from selenium.common import TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -8,12 +9,34 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+def traced(method: Callable) -> Callable:
+    """
+    Decorator for page-object methods that should be captured by the browser
+    tracer (BasePage.tracer). Without a tracer the method runs unchanged.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "BasePage", *args: Any, **kwargs: Any) -> Any:
+        action = f"{self.__class__.__name__}.{method.__name__}"
+        if self.tracer is None or not self.tracer.wants(action):
+            return method(self, *args, **kwargs)
+        with self.tracer.trace(action):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class BasePage:
     """
     BasePage acts as a parent class for all Page Object classes.
     It provides reusable utility methods such as click, send_keys, and waits,
     ensuring code reusability and cleaner test design.
     """
+    # Logging: level of the stderr handler and extra handlers (e.g. streaming file sinks)
+    # added to every page logger; set from environment.py before pages are created
+    stderr_log_level: int = logging.INFO
+    extra_log_handlers: List[logging.Handler] = []
+
+    # Optional utils.browser_trace.BrowserTracer used by @traced methods
+    tracer: Optional[Any] = None
 
     def __init__(self, driver: WebDriver):
         """
@@ -22,20 +45,48 @@ class BasePage:
         """
         self.driver = driver
 
+        # Durations (seconds) of timed actions, keyed by metric name, e.g. 'video_start'
+        self.timings: Dict[str, List[float]] = {}
+
         # --- Logger Configuration ---
-        self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.setLevel(logging.INFO)  # Default level
+        self.logger = self.configure_logger(self.__class__.__name__)
+
+    @classmethod
+    def configure_logger(cls, name: str) -> logging.Logger:
+        """
+        Configure a named logger like the page loggers: stderr handler plus extra handlers.
+        Also used for module loggers of the test utilities.
+        :param name: Logger name.
+        :return: The configured logger.
+        """
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)  # Default level
 
         # Prevent duplicate handlers
-        if not self.logger.handlers:
+        if not any(type(handler) is logging.StreamHandler for handler in logger.handlers):
             handler = logging.StreamHandler()
+            handler.setLevel(cls.stderr_log_level)
             formatter = logging.Formatter(
                 fmt="%(asctime)s — %(name)s — %(levelname)s — %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S"
             )
             handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
-            self.logger.propagate = False  # Prevent messages from propagating to root logger
+            logger.addHandler(handler)
+            logger.propagate = False  # Prevent messages from propagating to root logger
+
+        for extra_handler in cls.extra_log_handlers:
+            if extra_handler not in logger.handlers:
+                logger.addHandler(extra_handler)
+        return logger
+
+    def record_timing(self, name: str, seconds: float) -> None:
+        """
+        Store the duration of a timed action for performance budget checks.
+        :param name: Metric name (e.g. 'video_start', 'resolution_switch').
+        :param seconds: Measured duration in seconds.
+        """
+        self.timings.setdefault(name, []).append(seconds)
+        self.logger.info(f"⏱️ {name} took {seconds:.2f}s")
 
     def accept_cookies(self) -> None:
         """
@@ -1,13 +1,14 @@
 import time
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 
-from pages.base_page import BasePage
+from pages.base_page import BasePage, traced
 
 
 class HomePage(BasePage):
@@ -19,6 +20,139 @@ class HomePage(BasePage):
     # Elements
     ALL_TILES_HEADER: Tuple[str, str] = (By.XPATH, "//*[text()=' All Titles ']")
     TEST_AUTOMATION_PROJECT: Tuple[str, str] = (By.XPATH, "//*[text()='Test automation project']")
+    TEST_AUTOMATION_PROJECT_NAME: str = "Test automation project"
+
+    # Catalog scanning: scroll steps and time budget (ms) per script call, wait for lazily loaded rows (ms)
+    CATALOG_SCAN_STEPS: int = 10
+    CATALOG_SCAN_BUDGET_MS: int = 10000
+    CATALOG_SETTLE_MS: int = 250
+    # Wait for the first tiles to render (s) and upper bound for one full catalog scan (s)
+    CATALOG_TILE_WAIT_S: int = 15
+    CATALOG_SCAN_DEADLINE_S: int = 120
+    TITLE_TILE: Tuple[str, str] = (By.CSS_SELECTOR, '[aria-label^="Title - "]')
+
+    # Catalog index per browser session: session id -> {index, scan_y, complete}
+    _catalogs: Dict[str, Dict[str, Any]] = {}
+
+    # Shared JS helpers: title tiles carry aria-label="Title - <name>, ..."
+    _TILE_JS_HELPERS: str = """
+        const PREFIX = 'Title - ';
+        const sleep = ms => new Promise(resolve => setTimeout(resolve, ms));
+        const tilesIn = root => root.querySelectorAll('[aria-label^="' + PREFIX + '"]');
+        const nameOf = label => {
+            const rest = label.slice(PREFIX.length);
+            const cut = rest.lastIndexOf(',');
+            return (cut >= 0 ? rest.slice(0, cut) : rest).trim();
+        };
+        // Horizontally scrollable (possibly virtualized) rows holding tiles and intersecting the viewport
+        const rowsInView = () => {
+            const rows = new Set();
+            tilesIn(document).forEach(tile => {
+                for (let el = tile.parentElement; el && el !== document.body; el = el.parentElement) {
+                    const overflow = getComputedStyle(el).overflowX;
+                    if (el.scrollWidth > el.clientWidth && (overflow === 'auto' || overflow === 'scroll')) {
+                        const rect = el.getBoundingClientRect();
+                        if (rect.bottom > 0 && rect.top < window.innerHeight) rows.add(el);
+                        break;
+                    }
+                }
+            });
+            return Array.from(rows);
+        };
+    """
+
+    # Collects tiles while scrolling the page (and each visible row) incrementally.
+    # Rows are marked in the DOM when fully swept (data-catalog-scanned) or, when the
+    # time budget runs out mid-row, with the offset to resume from (data-catalog-left),
+    # so the next call continues where this one stopped.
+    # Args: start scroll Y, max vertical steps, time budget, settle time, lower-cased target name (or null).
+    CATALOG_SCAN_SCRIPT: str = _TILE_JS_HELPERS + """
+        const [startY, maxSteps, budgetMs, settleMs, target] = arguments;
+        const started = performance.now();
+        const overBudget = () => performance.now() - started > budgetMs;
+        const callback = arguments[arguments.length - 1];
+        const found = {};
+        const collect = (root, x) => tilesIn(root).forEach(tile => {
+            const label = tile.getAttribute('aria-label');
+            const name = nameOf(label);
+            const key = name.toLowerCase();
+            if (!(key in found)) found[key] = {name: name, label: label, y: window.scrollY, x: x};
+        });
+        // Sweep one row sideways; returns false if the budget ran out before the end of the row
+        const sweepRow = async row => {
+            const resumeAt = Number(row.dataset.catalogLeft || 0);
+            if (resumeAt) { row.scrollLeft = resumeAt; await sleep(settleMs); collect(row, row.scrollLeft); }
+            while (row.scrollLeft + row.clientWidth < row.scrollWidth - 1) {
+                if (overBudget()) { row.dataset.catalogLeft = String(row.scrollLeft); return false; }
+                const before = row.scrollLeft;
+                row.scrollLeft += row.clientWidth;
+                await sleep(settleMs);
+                if (row.scrollLeft === before) break;
+                collect(row, row.scrollLeft);
+            }
+            row.scrollLeft = 0;
+            delete row.dataset.catalogLeft;
+            row.dataset.catalogScanned = '1';
+            return true;
+        };
+        (async () => {
+            window.scrollTo(0, startY);
+            await sleep(settleMs);
+            let done = false;
+            for (let step = 0; step < maxSteps; step++) {
+                collect(document, 0);
+                let finished = true;
+                for (const row of rowsInView()) {
+                    if (row.dataset.catalogScanned) continue;
+                    if (!(await sweepRow(row))) { finished = false; break; }
+                }
+                // Out of time mid-row: stay at this scroll position and resume there next call
+                if (!finished || (target !== null && target in found)) break;
+
+                const height = document.documentElement.scrollHeight;
+                if (window.scrollY + window.innerHeight >= height - 1) {
+                    // Bottom reached: give infinite scroll a chance to append more rows
+                    await sleep(settleMs);
+                    if (document.documentElement.scrollHeight <= height) { done = true; break; }
+                }
+                window.scrollBy(0, Math.floor(window.innerHeight * 0.8));
+                await sleep(settleMs);
+                if (overBudget()) break;
+            }
+            callback({titles: found, nextY: window.scrollY, done: done});
+        })().catch(e => callback({error: String(e)}));
+    """
+
+    # Removes the row progress marks left by CATALOG_SCAN_SCRIPT.
+    CLEAR_SCAN_MARKS_SCRIPT: str = """
+        document.querySelectorAll('[data-catalog-scanned], [data-catalog-left]').forEach(row => {
+            delete row.dataset.catalogScanned;
+            delete row.dataset.catalogLeft;
+        });
+    """
+
+    # Scrolls back to an indexed tile position and returns the tile element (or null).
+    # Args: aria-label, scroll Y, row scroll offset, settle time.
+    LOCATE_TILE_SCRIPT: str = _TILE_JS_HELPERS + """
+        const [label, y, x, settleMs] = arguments;
+        const callback = arguments[arguments.length - 1];
+        const find = root => Array.from(tilesIn(root)).find(tile => tile.getAttribute('aria-label') === label);
+        (async () => {
+            window.scrollTo(0, y);
+            await sleep(settleMs);
+            let tile = find(document);
+            if (!tile && x > 0) {
+                for (const row of rowsInView()) {
+                    row.scrollLeft = x;
+                    await sleep(settleMs);
+                    tile = find(row);
+                    if (tile) break;
+                }
+            }
+            if (tile) tile.scrollIntoView({block: 'center', inline: 'center', behavior: 'instant'});
+            callback(tile || null);
+        })().catch(() => callback(null));
+    """
 
     def __init__(self, driver: WebDriver):
         """
@@ -44,40 +178,139 @@ class HomePage(BasePage):
             self.logger.error(f"❌ Home page did not load correctly: {e}")
             return False
 
-    def open_project(self) -> None:
+    @property
+    def _catalog(self) -> Dict[str, Any]:
         """
-        Opens a specific project from the Home page by its visible name.
+        Catalog state shared by all HomePage instances of the same browser session,
+        so the index survives across scenarios.
+        index: lower-cased title name -> {name, label, y, x}; scan_y: where scanning resumes.
         """
+        return self._catalogs.setdefault(
+            self.driver.session_id, {"index": {}, "scan_y": 0, "complete": False}
+        )
+
+    def _restart_scan(self) -> None:
+        """Scan again from the top of the page, keeping the titles indexed so far."""
+        self._catalog.update(scan_y=0, complete=False)
         try:
-            # Ensure home page is ready before proceeding
-            if not self.verify_home_page_loaded():
-                raise Exception("Home page not ready. Cannot select project.")
+            self.driver.execute_script(self.CLEAR_SCAN_MARKS_SCRIPT)
+        except Exception as e:
+            self.logger.warning(f"Could not clear catalog scan marks: {e}")
 
-            locator: Tuple[str, str] = (By.XPATH, "//*[@aria-label='Title - Test automation project, ']")
+    def reset_catalog(self) -> None:
+        """Forget the title index, e.g. after switching brands or when the catalog changed."""
+        self._catalog["index"].clear()
+        self._restart_scan()
 
-            # Wait for the project tile and click it
-            element = WebDriverWait(self.driver, 15).until(
-                EC.element_to_be_clickable(locator)
+    def _scan_catalog(self, target: Optional[str] = None) -> None:
+        """
+        Continue scanning the catalog from where the previous scan stopped.
+        Each script call scrolls at most CATALOG_SCAN_STEPS viewports (or until its
+        time budget is spent) and returns every tile it saw, so the scan is
+        incremental and stays within the async script timeout set here.
+        :param target: Stop as soon as this title (lower-cased) is indexed.
+        """
+        catalog = self._catalog
+        if catalog["scan_y"] == 0 and not catalog["complete"]:
+            # Tiles render after the home page header; scanning an empty page would mark it complete
+            WebDriverWait(self.driver, self.CATALOG_TILE_WAIT_S).until(
+                EC.presence_of_element_located(self.TITLE_TILE)
             )
+        # Budget plus the settle waits that may follow the last budget check, plus a margin
+        self.driver.set_script_timeout((self.CATALOG_SCAN_BUDGET_MS + 4 * self.CATALOG_SETTLE_MS) / 1000 + 5)
 
-            # Scroll element into view
-            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", element)
-            time.sleep(0.3)  # 300ms pause to ensure scroll completes
+        deadline = time.monotonic() + self.CATALOG_SCAN_DEADLINE_S
+        while not catalog["complete"] and (target is None or target not in catalog["index"]):
+            if time.monotonic() > deadline:
+                # An endlessly growing feed never completes; resume from scan_y on the next call
+                self.logger.warning(f"⚠️ Catalog scan stopped after {self.CATALOG_SCAN_DEADLINE_S}s "
+                                    f"with {len(catalog['index'])} titles indexed.")
+                break
+            result = self.driver.execute_async_script(
+                self.CATALOG_SCAN_SCRIPT, catalog["scan_y"], self.CATALOG_SCAN_STEPS, self.CATALOG_SCAN_BUDGET_MS,
+                self.CATALOG_SETTLE_MS, target
+            )
+            if result.get("error"):
+                raise Exception(f"Catalog scan failed: {result['error']}")
 
-            # Hover over the element
-            ActionChains(self.driver).move_to_element(element).perform()
-            time.sleep(0.1)  # tiny pause after hover
-            self.logger.info(f"Hovered over project tile:")
+            # Newer positions replace stale ones (e.g. after a rescan for a moved tile)
+            catalog["index"].update(result["titles"])
+            catalog["scan_y"] = result["nextY"]
+            catalog["complete"] = result["done"]
+            self.logger.info(f"📚 Indexed {len(catalog['index'])} titles (scroll position {catalog['scan_y']}).")
 
-            element.click()
+    def get_catalog_titles(self, refresh: bool = False) -> List[str]:
+        """
+        Enumerate every title in the catalog, scrolling through lazily loaded rows.
+        :param refresh: Discard the cached index and scan again.
+        :return: Title names in the order they were discovered.
+        """
+        if refresh:
+            self.reset_catalog()
+        self._scan_catalog()
+        return [entry["name"] for entry in self._catalog["index"].values()]
 
-            self.logger.info(f"✅ Opened project")
+    def find_title(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a title in the index, scanning further only if it is not indexed yet.
+        :param name: Visible title name (case-insensitive).
+        :return: Index entry {name, label, y, x} or None if the title does not exist.
+        """
+        key = name.strip().lower()
+        if key not in self._catalog["index"]:
+            if self._catalog["complete"]:
+                # The catalog may have changed since it was fully indexed; rescan once from the top
+                self._restart_scan()
+            self._scan_catalog(target=key)
+        return self._catalog["index"].get(key)
 
-            # Optional: Wait until project navigation completes
-            WebDriverWait(self.driver, 10).until_not(
-                EC.presence_of_element_located(locator)
-            )
-            self.logger.info("ℹ️ Navigated to the project details page successfully.")
+    def _locate_tile(self, entry: Dict[str, Any]) -> Optional[WebElement]:
+        """
+        Scroll back to an indexed tile and return its element.
+        :param entry: Index entry returned by find_title.
+        :return: Tile WebElement, or None if it is no longer rendered there.
+        """
+        return self.driver.execute_async_script(
+            self.LOCATE_TILE_SCRIPT, entry["label"], entry["y"], entry["x"], self.CATALOG_SETTLE_MS
+        )
+
+    @traced
+    def open_title(self, name: str) -> None:
+        """
+        Open any title from the Home page by its visible name.
+        :param name: Visible title name (case-insensitive).
+        """
+        if not self.verify_home_page_loaded():
+            raise Exception("Home page not ready. Cannot select project.")
 
+        entry = self.find_title(name)
+        if entry is None:
+            raise Exception(f"Title '{name}' not found in catalog.")
+
+        element = self._locate_tile(entry)
+        if element is None:
+            # Virtualized rows may have shifted since indexing; rescan for this title only
+            self.logger.info(f"ℹ️ Tile '{name}' moved, re-indexing.")
+            self._catalog["index"].pop(entry["name"].lower(), None)
+            self._restart_scan()
+            entry = self.find_title(name)
+            element = self._locate_tile(entry) if entry else None
+            if element is None:
+                raise Exception(f"Title '{name}' could not be located on the page.")
+
+        # Hover over the tile and click it
+        ActionChains(self.driver).move_to_element(element).pause(0.1).click().perform()
+        self.logger.info(f"✅ Opened title '{entry['name']}'")
+
+        # Wait until project navigation completes
+        WebDriverWait(self.driver, 10).until(EC.staleness_of(element))
+        self.logger.info("ℹ️ Navigated to the project details page successfully.")
+
+    def open_project(self) -> None:
+        """
+        Opens the 'Test automation project' title from the Home page.
+        """
+        try:
+            self.open_title(self.TEST_AUTOMATION_PROJECT_NAME)
         except Exception as e:
             self.logger.error(f"❌ Failed to open Test automation project: {e}")
@@ -1,3 +1,4 @@
+import time
 from typing import Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
@@ -73,6 +74,7 @@ class LoginPage(BasePage):
         try:
             # Step 1: Enter PIN and click Sign-In
             self.send_keys(self.PIN_FIELD, pin)
+            start_time = time.perf_counter()
             self.click(self.SIGN_IN_BTN)
             self.logger.info("PIN entered and Sign-In button clicked.")
 
@@ -86,9 +88,11 @@ class LoginPage(BasePage):
                 raise ValueError(f"Unknown brand name: {brand_name}. Use 'default' or 'indee'.")
 
             # Step 3: Wait for brand card and click it
-            WebDriverWait(self.driver, 10).until(
+            brand_card = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable(locator)
-            ).click()
+            )
+            self.record_timing("sign_in", time.perf_counter() - start_time)
+            brand_card.click()
 
             self.logger.info(f"✅ Brand '{brand_name}' selected successfully.")
 
@@ -1,11 +1,12 @@
 import time
 from typing import Tuple
+from selenium.common import TimeoutException
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webdriver import WebDriver
-from pages.base_page import BasePage
+from pages.base_page import BasePage, traced
 
 
 class VideoPage(BasePage):
@@ -26,6 +27,26 @@ class VideoPage(BasePage):
     VOLUME_SLIDER: Tuple[str, str] = (By.XPATH, "//*[@class='jw-horizontal-volume-container']")
     LOGOUT_ICON: Tuple[str, str] = (By.XPATH, "//button[@id='signOutSideBar']")
 
+    # Player state checks, run inside the 'video_player' iframe
+    PLAYBACK_STARTED_SCRIPT: str = """
+        const video = document.querySelector('video');
+        return !!video && !video.paused && video.currentTime > 0;
+    """
+    QUALITY_SWITCHED_SCRIPT: str = """
+        const target = arguments[0];
+        const video = document.querySelector('video');
+        let quality = null;
+        try {
+            const visual = window.jwplayer && jwplayer().getVisualQuality();
+            quality = visual && visual.level ? String(visual.level.label) : null;
+        } catch (e) {}
+        if (quality === null) {
+            return null;  // quality level unknown: not switched yet
+        }
+        const ready = !video || (video.readyState >= 3 && !video.seeking);
+        return ready && quality.indexOf(target) !== -1;
+    """
+
     def __init__(self, driver: WebDriver):
         """
         Initialize VideoPage with WebDriver. Logger is inherited from BasePage.
@@ -58,6 +79,7 @@ class VideoPage(BasePage):
             self.logger.error(f"❌ Video project page did not load correctly: {e}")
             return False
 
+    @traced
     def switch_to_details_tab(self) -> None:
         """Switch to the 'Details' tab on the video page."""
         try:
@@ -79,6 +101,7 @@ class VideoPage(BasePage):
         except Exception as e:
             self.logger.error(f"❌ Failed to switch to details tab: {e}")
 
+    @traced
     def switch_to_videos_tab(self) -> None:
         """Switch to the 'Videos' tab on the video page."""
         try:
@@ -92,14 +115,37 @@ class VideoPage(BasePage):
     def play_video(self) -> None:
         """Play the selected video."""
         try:
-            WebDriverWait(self.driver, 10).until(
+            play_btn = WebDriverWait(self.driver, 10).until(
                 EC.element_to_be_clickable(self.PLAY_BTN)
-            ).click()
+            )
+            start_time = time.perf_counter()
+            play_btn.click()
             self.logger.info("▶️ Video started playing.")
+            self._record_video_start(start_time)
             time.sleep(5)
         except Exception as e:
             self.logger.error(f"❌ Failed to play video: {e}")
 
+    def _record_video_start(self, start_time: float, timeout: int = 15) -> None:
+        """
+        Record the time from clicking Play until the player reports advancing playback.
+        :param start_time: time.perf_counter() value taken just before the Play click.
+        :param timeout: Maximum wait in seconds; a timeout is recorded as-is.
+        """
+        iframe = WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located((By.ID, "video_player"))
+        )
+        self.driver.switch_to.frame(iframe)
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(self.PLAYBACK_STARTED_SCRIPT)
+            )
+        except TimeoutException:
+            self.logger.warning(f"⏳ Playback did not start within {timeout}s.")
+        finally:
+            self.driver.switch_to.default_content()
+        self.record_timing("video_start", time.perf_counter() - start_time)
+
     def pause_video_after_10_sec(self) -> None:
         """Play the video and pause it once elapsed time reaches max_seconds (default 10)."""
         try:
@@ -286,6 +332,7 @@ class VideoPage(BasePage):
             except Exception:
                 pass
 
+    @traced
     def change_resolution(self, resolution: str = "720p") -> None:
         """
         Change video resolution using JW Player settings safely.
@@ -315,9 +362,29 @@ class VideoPage(BasePage):
 
             # Step 4: Scroll into view and click desired resolution
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", quality_option)
-            ActionChains(self.driver).move_to_element(quality_option).pause(0.2).click().perform()
+            ActionChains(self.driver).move_to_element(quality_option).pause(0.2).perform()
+            switch_start = time.perf_counter()
+            ActionChains(self.driver).click().perform()
             self.logger.info(f"✅ Resolution changed successfully to {resolution}.")
 
+            # Time until the player renders the new quality level; only confirmed switches are recorded
+            quality_read = False
+
+            def quality_switched(driver: WebDriver) -> bool:
+                nonlocal quality_read
+                state = driver.execute_script(self.QUALITY_SWITCHED_SCRIPT, resolution)
+                quality_read = quality_read or state is not None
+                return state is True
+
+            try:
+                WebDriverWait(self.driver, 15, poll_frequency=0.1).until(quality_switched)
+                self.record_timing("resolution_switch", time.perf_counter() - switch_start)
+            except TimeoutException:
+                if quality_read:
+                    self.logger.warning(f"⏳ Player did not switch to {resolution} within 15s, switch not timed.")
+                else:
+                    self.logger.warning("⚠️ Could not read the player quality level, resolution switch not timed.")
+
             # Step 5: Optional — click outside to close settings
             ActionChains(self.driver).move_by_offset(50, 0).click().perform()
             self.logger.info("✅ Closed settings menu after resolution change.")
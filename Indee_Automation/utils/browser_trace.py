@@ -0,0 +1,213 @@
+"""
+Browser-side tracing around page-object actions (Chrome only).
+
+Chrome must be started with the performance log enabled and timeline trace
+categories (see chrome_trace_options). For each traced action the tracer saves
+the Chrome timeline events plus Performance domain metric deltas to one JSON
+file, and logs a summary attributing the time to the app's main thread.
+
+Summarize saved traces with:
+    python -m utils.browser_trace summarize browser_traces/
+"""
+import argparse
+import glob
+import json
+import logging
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.base_page import BasePage
+
+logger = logging.getLogger("BrowserTracer")
+
+TRACE_CATEGORIES: str = "devtools.timeline,disabled-by-default-devtools.timeline,toplevel"
+
+# Tasks longer than this block the main thread noticeably (same threshold as the Long Tasks API)
+LONG_TASK_MS: float = 50.0
+
+# Top-level task event names, newest Chrome first; only one set is used to avoid double counting
+TASK_EVENTS: Tuple[str, ...] = ("RunTask", "ThreadControllerImpl::RunTask")
+LAYOUT_EVENTS: Set[str] = {"Layout", "UpdateLayoutTree"}
+PAINT_EVENTS: Set[str] = {"PrePaint", "Paint", "PaintImage", "Layerize", "UpdateLayer", "CompositeLayers"}
+
+# Cumulative Performance.getMetrics values (seconds) reported as deltas per action
+DURATION_METRICS: Tuple[str, ...] = ("TaskDuration", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration")
+
+
+def chrome_trace_options(chrome_options: Options) -> None:
+    """
+    Enable the performance log with timeline trace categories on Chrome options.
+    :param chrome_options: Options used to start Chrome.
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    chrome_options.add_experimental_option("perfLoggingPrefs", {
+        "enableNetwork": False,
+        "enablePage": False,
+        "traceCategories": TRACE_CATEGORIES,
+    })
+
+
+def summarize_trace(events: List[Dict[str, Any]], wall_ms: float,
+                    metrics: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+    """
+    Extract long tasks, layout/paint time and main-thread busy share from trace events.
+    :param events: Chrome trace events (Trace Event Format, durations in µs).
+    :param wall_ms: Wall-clock duration of the action in milliseconds.
+    :param metrics: Performance metric deltas in seconds (optional).
+    :return: Summary dictionary with values in milliseconds.
+    """
+    main_threads = {
+        (e.get("pid"), e.get("tid")) for e in events
+        if e.get("ph") == "M" and e.get("name") == "thread_name" and e.get("args", {}).get("name") == "CrRendererMain"
+    }
+    if not main_threads:
+        # No thread metadata in the log: layout and paint only run on renderer main threads
+        main_threads = {(e.get("pid"), e.get("tid")) for e in events if e.get("name") in LAYOUT_EVENTS | PAINT_EVENTS}
+    complete = [e for e in events if e.get("ph") == "X" and (e.get("pid"), e.get("tid")) in main_threads]
+    task_name = next((name for name in TASK_EVENTS if any(e["name"] == name for e in complete)), None)
+
+    task_ms = [e.get("dur", 0) / 1000 for e in complete if e["name"] == task_name]
+    long_tasks = [ms for ms in task_ms if ms > LONG_TASK_MS]
+    busy_ms = sum(task_ms)
+    summary = {
+        "wall_ms": round(wall_ms, 1),
+        "main_thread_busy_ms": round(busy_ms, 1),
+        # Several renderer main threads (e.g. the out-of-process player iframe) can overlap
+        "main_thread_busy_pct": round(100 * busy_ms / wall_ms, 1) if wall_ms else 0.0,
+        "long_tasks": len(long_tasks),
+        "long_task_ms": round(sum(long_tasks), 1),
+        "longest_task_ms": round(max(task_ms, default=0.0), 1),
+        "layout_ms": round(sum(e.get("dur", 0) for e in complete if e["name"] in LAYOUT_EVENTS) / 1000, 1),
+        "paint_ms": round(sum(e.get("dur", 0) for e in complete if e["name"] in PAINT_EVENTS) / 1000, 1),
+    }
+    for name, seconds in (metrics or {}).items():
+        summary[f"{name}_ms"] = round(seconds * 1000, 1)
+    return summary
+
+
+class BrowserTracer:
+    """
+    Captures Chrome timeline events and Performance metrics around page-object
+    actions and saves one JSON file per action. Attach it as BasePage.tracer;
+    methods decorated with pages.base_page.traced are then traced.
+    """
+
+    def __init__(self, driver: WebDriver, output_dir: str, actions: Optional[List[str]] = None):
+        """
+        Initialize the tracer.
+        :param driver: Chrome WebDriver started with chrome_trace_options.
+        :param output_dir: Directory for per-action trace files (created if missing).
+        :param actions: Only trace these actions ('Class.method'); all when None.
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        # Same handlers as the page loggers, so action summaries are not dropped
+        BasePage.configure_logger(logger.name)
+        self.driver = driver
+        self.output_dir = output_dir
+        self.actions = set(actions) if actions else None
+        self.step_name = ""
+        self.summaries: List[Dict[str, Any]] = []
+        self._active = False
+        self._count = 0
+
+    def wants(self, action: str) -> bool:
+        """
+        Whether an action should be traced (not filtered out and no trace running).
+        :param action: Action name, 'Class.method'.
+        """
+        return not self._active and (self.actions is None or action in self.actions)
+
+    def _metrics(self) -> Dict[str, float]:
+        """Return the cumulative duration metrics of the current page."""
+        result = self.driver.execute_cdp_cmd("Performance.getMetrics", {})
+        return {m["name"]: m["value"] for m in result.get("metrics", []) if m["name"] in DURATION_METRICS}
+
+    def _trace_events(self) -> List[Dict[str, Any]]:
+        """Drain the performance log and return the trace events it contains."""
+        events = []
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"]).get("message", {})
+            if message.get("method") == "Tracing.dataCollected":
+                events.append(message.get("params", {}))
+        return events
+
+    @contextmanager
+    def trace(self, action: str) -> Iterator[None]:
+        """
+        Trace the enclosed block and save the result as '<n>-<step>-<action>.json'.
+        :param action: Action name, 'Class.method'.
+        """
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+            self._trace_events()  # discard events from before the action
+            before = self._metrics()
+        except Exception as e:
+            logger.warning(f"Could not start browser tracing for {action}: {e}")
+            before = None
+
+        if before is None:
+            yield
+            return
+
+        self._active = True
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            try:
+                wall_ms = (time.perf_counter() - start) * 1000
+                after = self._metrics()
+                events = self._trace_events()
+                # Counters restart when the action navigates to a new document
+                metrics = {name: value - before.get(name, 0.0) if value >= before.get(name, 0.0) else value
+                           for name, value in after.items()}
+                self._save(action, wall_ms, metrics, events)
+            except Exception as e:
+                logger.warning(f"Could not collect browser trace for {action}: {e}")
+            finally:
+                self._active = False
+
+    def _save(self, action: str, wall_ms: float, metrics: Dict[str, float], events: List[Dict[str, Any]]) -> None:
+        """Summarize an action and write its trace file."""
+        self._count += 1
+        summary = summarize_trace(events, wall_ms, metrics)
+        summary.update(step=self.step_name, action=action)
+        self.summaries.append(summary)
+
+        step_slug = re.sub(r"[^A-Za-z0-9]+", "_", self.step_name).strip("_")[:60]
+        path = os.path.join(self.output_dir, f"{self._count:03d}-{step_slug}-{action}.json")
+        with open(path, "w", encoding="utf-8") as trace_file:
+            # traceEvents makes the file loadable in chrome://tracing and Perfetto
+            json.dump({"summary": summary, "metrics": metrics, "traceEvents": events}, trace_file)
+        logger.info(f"{action}: {summary['wall_ms']}ms wall, {summary['main_thread_busy_pct']}% main thread busy, "
+                    f"{summary['long_tasks']} long tasks, layout {summary['layout_ms']}ms, "
+                    f"paint {summary['paint_ms']}ms -> {path}")
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Summarize browser traces captured around page-object actions.")
+    commands = parser.add_subparsers(dest="action", required=True)
+    summarize = commands.add_parser("summarize", help="Print a summary table for saved traces")
+    summarize.add_argument("directory")
+
+    args = parser.parse_args()
+    print(f"{'step / action':<70} {'wall':>8} {'busy%':>6} {'long':>5} {'longest':>8} {'layout':>7} {'paint':>7}")
+    for path in sorted(glob.glob(os.path.join(args.directory, "*.json"))):
+        with open(path, encoding="utf-8") as trace_file:
+            data = json.load(trace_file)
+        summary = summarize_trace(data.get("traceEvents", []), data["summary"]["wall_ms"], data.get("metrics"))
+        label = f"{data['summary'].get('step', '')} / {data['summary'].get('action', '')}"
+        print(f"{label[:70]:<70} {summary['wall_ms']:>8} {summary['main_thread_busy_pct']:>6} "
+              f"{summary['long_tasks']:>5} {summary['longest_task_ms']:>8} {summary['layout_ms']:>7} "
+              f"{summary['paint_ms']:>7}")
+
+
+if __name__ == "__main__":
+    main()
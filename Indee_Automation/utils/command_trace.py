@@ -0,0 +1,330 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from pages.base_page import BasePage
+
+# W3C key used for element references in WebDriver responses
+ELEMENT_KEY: str = "element-6066-11e4-a52e-4f735466cecf"
+SHADOW_ROOT_KEY: str = "shadow-6066-11e4-a52e-4f735466cecf"
+
+# Parameter strings longer than this (e.g. uploaded files) are stored as a length only
+MAX_VALUE_LENGTH: int = 256
+
+# Response values whose JSON is larger than this (screenshots, page source, getLog
+# dumps) are stored out-of-line in '<trace>.blobs/<sha1>.json.gz' and referenced by hash
+MAX_INLINE_RESPONSE_BYTES: int = 4096
+
+# Exception class name -> W3C error code, used to reproduce failures on replay
+ERROR_CODES: Dict[str, str] = {
+    "NoSuchElementException": "no such element",
+    "NoSuchFrameException": "no such frame",
+    "StaleElementReferenceException": "stale element reference",
+    "ElementClickInterceptedException": "element click intercepted",
+    "ElementNotInteractableException": "element not interactable",
+    "JavascriptException": "javascript error",
+    "MoveTargetOutOfBoundsException": "move target out of bounds",
+    "TimeoutException": "timeout",
+}
+
+logger = logging.getLogger("CommandTrace")
+
+
+def _compact(value: Any, truncate: bool = True) -> Any:
+    """
+    Convert a command parameter or response value into a JSON-safe form.
+    Elements become W3C references; long strings are replaced by their length if truncate is set.
+    :param value: Raw value passed to or returned from WebDriver.execute.
+    :param truncate: Replace strings longer than MAX_VALUE_LENGTH by their length.
+    :return: JSON-serializable value.
+    """
+    if isinstance(value, WebElement):
+        return {ELEMENT_KEY: value.id}
+    if isinstance(value, str):
+        return value if not truncate or len(value) <= MAX_VALUE_LENGTH else {"__truncated__": len(value)}
+    if isinstance(value, dict):
+        return {k: _compact(v, truncate) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_compact(v, truncate) for v in value]
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return repr(value)
+
+
+def _normalize(value: Any) -> Any:
+    """
+    Strip session-specific data (session and element ids) so that the same
+    logical command produces the same key in different runs.
+    :param value: Compacted command parameters.
+    :return: Normalized value.
+    """
+    if isinstance(value, dict):
+        if ELEMENT_KEY in value or SHADOW_ROOT_KEY in value:
+            return "<element>"
+        return {k: _normalize(v) for k, v in value.items() if k != "sessionId"}
+    if isinstance(value, list):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def command_key(command: str, params: Any) -> str:
+    """
+    Build the lookup key used to match a live command against a recorded one.
+    :param command: WebDriver command name (e.g. 'findElement').
+    :param params: Command parameters (raw or compacted).
+    :return: Stable string key.
+    """
+    return f"{command} {json.dumps(_normalize(_compact(params or {})), sort_keys=True)}"
+
+
+def blob_dir(trace_path: str) -> str:
+    """
+    Directory holding the out-of-line response values of a trace.
+    :param trace_path: Path of the JSONL trace file.
+    :return: '<trace_path>.blobs'
+    """
+    return f"{trace_path}.blobs"
+
+
+def summarize_response(value: Any) -> str:
+    """
+    Produce a short human-readable summary of a response value.
+    :param value: Response value (after _compact).
+    :return: Summary such as 'element', 'list[3]' or 'str[12]'.
+    """
+    if isinstance(value, dict):
+        if ELEMENT_KEY in value:
+            return "element"
+        return f"dict[{len(value)}]"
+    if isinstance(value, list):
+        return f"list[{len(value)}]"
+    if isinstance(value, str):
+        return f"str[{len(value)}]"
+    return type(value).__name__
+
+
+def _page_object_caller() -> str:
+    """
+    Walk up the call stack and return the innermost page-object method found,
+    looking through BasePage helpers to the method that called them.
+    :return: 'ClassName.method' or '<test>' when called outside page objects.
+    """
+    helper = "<test>"
+    frame = sys._getframe(1)
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        name = frame.f_code.co_name
+        # Skip lambdas and decorator wrappers (e.g. @traced) that are not methods of the page class
+        if isinstance(owner, BasePage) and hasattr(type(owner), name):
+            method = f"{owner.__class__.__name__}.{name}"
+            # Shared BasePage helpers (click, send_keys, ...) are attributed to the page method calling them
+            if name not in vars(BasePage):
+                return method
+            if helper == "<test>":
+                helper = method
+        frame = frame.f_back
+    return helper
+
+
+class CommandRecorder:
+    """
+    Records every WebDriver command issued through a driver to a JSONL trace.
+    Each line holds the command, its parameters, the calling page-object method,
+    the latency and a compact copy of the response so the trace can be replayed.
+    """
+
+    def __init__(self, driver: WebDriver, trace_path: str):
+        """
+        Initialize the recorder. Call attach() to start recording.
+        :param driver: WebDriver instance to record.
+        :param trace_path: Path of the JSONL trace file to write.
+        """
+        self.driver = driver
+        self.trace_path = trace_path
+        self._file = None
+        self._execute = None
+        self._seq = 0
+
+    def attach(self) -> None:
+        """Start intercepting driver.execute and writing trace records."""
+        # Line-buffered so a killed or crashed run still leaves a complete trace up to that point
+        self._file = open(self.trace_path, "w", encoding="utf-8", buffering=1)
+        self._execute = self.driver.execute
+        self.driver.execute = self._record
+        logger.info(f"Recording WebDriver commands to {self.trace_path}")
+
+    def detach(self) -> None:
+        """Restore the original driver.execute and close the trace file."""
+        if self._execute is not None:
+            self.driver.execute = self._execute
+            self._execute = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            logger.info(f"Recorded {self._seq} WebDriver commands to {self.trace_path}")
+
+    def _store_value(self, value: Any) -> Any:
+        """
+        Keep small response values inline; write large ones to the blob directory.
+        :param value: Compacted response value.
+        :return: The value itself, or {'__blob__': sha1, 'size': bytes} for large values.
+        """
+        encoded = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        if len(encoded) <= MAX_INLINE_RESPONSE_BYTES:
+            return value
+        digest = hashlib.sha1(encoded).hexdigest()
+        path = os.path.join(blob_dir(self.trace_path), f"{digest}.json.gz")
+        if not os.path.exists(path):
+            os.makedirs(blob_dir(self.trace_path), exist_ok=True)
+            with gzip.open(path, "wb") as blob:
+                blob.write(encoded)
+        return {"__blob__": digest, "size": len(encoded)}
+
+    def _record(self, driver_command: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Execute the command through the original driver and log it."""
+        caller = _page_object_caller()
+        compact_params = _compact(params or {})
+        start = time.perf_counter()
+        record: Dict[str, Any] = {"command": driver_command, "params": compact_params, "caller": caller}
+        try:
+            response = self._execute(driver_command, params)
+            value = _compact(response.get("value") if response else None, truncate=False)
+            record.update(status="ok", value=self._store_value(value), response=summarize_response(value))
+            return response
+        except Exception as e:
+            record.update(status="error", error=ERROR_CODES.get(type(e).__name__, "unknown error"),
+                          exception=type(e).__name__, response=(getattr(e, "msg", None) or str(e)).split("\n")[0])
+            raise
+        finally:
+            self._seq += 1
+            record.update(seq=self._seq, ts=time.time(),
+                          latency_ms=round((time.perf_counter() - start) * 1000, 3))
+            if self._file is not None:
+                self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def read_trace(trace_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a JSONL trace file.
+    :param trace_path: Path of the trace file.
+    :return: Iterator over trace records.
+    """
+    with open(trace_path, encoding="utf-8") as trace:
+        for line in trace:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ReplayExecutor:
+    """
+    Command executor that answers WebDriver commands from a recorded trace
+    instead of a browser. Pass it to webdriver.Remote (see replay_driver) to run
+    page objects offline and deterministically.
+
+    Responses are matched by command and normalized parameters, in recorded
+    order. Commands missing from the trace fall back to the next recorded
+    response for the same command name, then to a 'no such element' error for
+    element lookups (an empty list for findElements) or an empty success response.
+    """
+
+    def __init__(self, trace_path: str, speed: float = 0.0, strict: bool = False):
+        """
+        Load the trace into per-command response queues.
+        :param trace_path: Path of the JSONL trace recorded by CommandRecorder.
+        :param speed: Latency multiplier; 0 replays instantly, 1.0 at recorded speed.
+        :param strict: Raise on commands that are not present in the trace.
+        """
+        self.speed = speed
+        self.strict = strict
+        self.blob_dir = blob_dir(trace_path)
+        self.misses: List[str] = []
+        self._by_key: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        self._by_command: Dict[str, Deque[Dict[str, Any]]] = defaultdict(deque)
+        for record in read_trace(trace_path):
+            self._by_key[command_key(record["command"], record["params"])].append(record)
+            self._by_command[record["command"]].append(record)
+
+    def _take(self, command: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Pop the best matching record for a command, or None."""
+        exact = self._by_key.get(command_key(command, params))
+        if exact:
+            record = exact.popleft()
+            self._by_command[command].remove(record)
+            return record
+        fallback = self._by_command.get(command)
+        if fallback and not self.strict:
+            record = fallback.popleft()
+            self._by_key[command_key(command, record["params"])].remove(record)
+            return record
+        return None
+
+    def execute(self, command: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the recorded response for a command in WebDriver wire format.
+        :param command: WebDriver command name.
+        :param params: Command parameters as sent by WebDriver.execute.
+        :return: Response dictionary understood by the WebDriver error handler.
+        """
+        if command == "newSession":
+            return {"value": {"sessionId": "replay", "capabilities": {"browserName": "replay"}}}
+
+        record = self._take(command, params)
+        if record is None:
+            self.misses.append(command_key(command, params))
+            if self.strict:
+                raise KeyError(f"Command not found in trace: {self.misses[-1]}")
+            # Unrecorded lookups behave like lookups on a page without the element
+            if command in ("findElements", "findChildElements"):
+                return {"value": []}
+            if command in ("findElement", "findChildElement"):
+                message = f"Element not found in trace: {params.get('using')}={params.get('value')}"
+                return {"status": "no such element",
+                        "value": {"error": "no such element", "message": message, "stacktrace": ""}}
+            return {"value": None}
+
+        if self.speed:
+            time.sleep(record["latency_ms"] / 1000 * self.speed)
+        if record["status"] == "error":
+            return {"status": record["error"],
+                    "value": {"error": record["error"], "message": record.get("response", ""), "stacktrace": ""}}
+        return {"value": self._load_value(record.get("value"))}
+
+    def _load_value(self, value: Any) -> Any:
+        """Resolve an out-of-line response value written by CommandRecorder."""
+        if not (isinstance(value, dict) and "__blob__" in value):
+            return value
+        path = os.path.join(self.blob_dir, f"{value['__blob__']}.json.gz")
+        if not os.path.exists(path):
+            logger.warning(f"Missing response blob {path}, replaying None")
+            return None
+        with gzip.open(path, "rb") as blob:
+            return json.loads(blob.read().decode("utf-8"))
+
+    def close(self) -> None:
+        """Called by WebDriver.quit(); report commands that were not in the trace."""
+        if self.misses:
+            logger.warning(f"{len(self.misses)} replayed commands were not found in the trace")
+
+
+def replay_driver(trace_path: str, speed: float = 0.0, strict: bool = False) -> Tuple[WebDriver, ReplayExecutor]:
+    """
+    Create a WebDriver whose commands are served from a recorded trace.
+    :param trace_path: Path of the JSONL trace recorded by CommandRecorder.
+    :param speed: Latency multiplier; 0 replays instantly, 1.0 at recorded speed.
+    :param strict: Raise on commands that are not present in the trace.
+    :return: (driver, executor) — inspect executor.misses after the run.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    executor = ReplayExecutor(trace_path, speed=speed, strict=strict)
+    return webdriver.Remote(command_executor=executor, options=Options()), executor
@@ -0,0 +1,111 @@
+import json
+import logging
+import os
+import statistics
+from typing import Any, Dict, List, Optional
+
+from pages.base_page import BasePage
+
+logger = logging.getLogger("PerfBaseline")
+
+# behave context attributes holding the page objects of a scenario
+SCENARIO_PAGES: List[str] = ["login_page", "home_page", "video_page"]
+
+
+def page_timings(*pages: Optional[BasePage]) -> Dict[str, List[float]]:
+    """
+    Merge the timings collected by several page objects.
+    :param pages: Page objects (None entries are ignored).
+    :return: Metric name -> list of durations in seconds.
+    """
+    timings: Dict[str, List[float]] = {}
+    for page in pages:
+        if page is not None:
+            for name, samples in page.timings.items():
+                timings.setdefault(name, []).extend(samples)
+    return timings
+
+
+def scenario_timings(context: Any) -> Dict[str, List[float]]:
+    """
+    Collect the timings recorded by the page objects of the current scenario.
+    :param context: behave context.
+    :return: Metric name -> list of durations in seconds.
+    """
+    return page_timings(*(getattr(context, name, None) for name in SCENARIO_PAGES))
+
+
+class PerfBaseline:
+    """
+    JSON store of historical timings per metric, used to detect performance
+    regressions. A value is a regression when it is both statistically unusual
+    (robust z-score against the median/MAD of recent history) and slower than
+    the median by a meaningful absolute margin.
+    """
+
+    def __init__(self, path: str, window: int = 30, min_samples: int = 5,
+                 threshold: float = 3.5, min_delta: float = 0.25):
+        """
+        Load the baseline file if it exists.
+        :param path: Path of the JSON baseline file.
+        :param window: Number of most recent samples kept per metric.
+        :param min_samples: History needed before a metric is gated.
+        :param threshold: Robust z-score above which a value is a regression.
+        :param min_delta: Minimum slowdown in seconds over the median to fail.
+        """
+        self.path = path
+        self.window = window
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self.min_delta = min_delta
+        self.history: Dict[str, List[float]] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as baseline:
+                self.history = json.load(baseline)
+
+    def check(self, metric: str, value: float) -> Optional[str]:
+        """
+        Compare a measured value against the metric's history.
+        :param metric: Metric name (e.g. 'video_start').
+        :param value: Measured duration in seconds.
+        :return: Description of the regression, or None if the value is acceptable.
+        """
+        samples = self.history.get(metric, [])
+        if len(samples) < self.min_samples:
+            logger.info(f"Not enough history for '{metric}' ({len(samples)}/{self.min_samples}), not gated")
+            return None
+
+        median = statistics.median(samples)
+        mad = statistics.median(abs(s - median) for s in samples)
+        # 1.4826 * MAD estimates the standard deviation; floor it so a perfectly stable history still tolerates noise
+        spread = max(1.4826 * mad, 0.05 * median, 1e-3)
+        score = (value - median) / spread
+        if score > self.threshold and value - median > self.min_delta:
+            return (f"{metric}: {value:.2f}s vs median {median:.2f}s over {len(samples)} runs "
+                    f"(z={score:.1f} > {self.threshold})")
+        return None
+
+    def check_all(self, timings: Dict[str, List[float]]) -> List[str]:
+        """
+        Check the slowest sample of every metric.
+        :param timings: Metric name -> measured durations (see page_timings).
+        :return: List of regression descriptions (empty if none).
+        """
+        regressions = [self.check(metric, max(samples)) for metric, samples in timings.items() if samples]
+        return [r for r in regressions if r]
+
+    def add(self, timings: Dict[str, List[float]]) -> None:
+        """
+        Append the timings of a passing run to the history.
+        :param timings: Metric name -> measured durations (see page_timings).
+        """
+        for metric, samples in timings.items():
+            self.history[metric] = (self.history.get(metric, []) + samples)[-self.window:]
+
+    def save(self) -> None:
+        """Write the history atomically so concurrent readers never see a partial file."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as baseline:
+            json.dump(self.history, baseline, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        logger.info(f"Saved performance baseline to {self.path}")
@@ -0,0 +1,202 @@
+"""
+Streaming, memory-bounded sinks for test results, step timings and log records.
+
+Records are buffered in small batches and appended to gzip-compressed JSONL
+files that rotate once they reach a size limit, so memory stays flat however
+long the run is. Each worker writes its own streams; merge them with:
+    python -m utils.result_sink merge merged.jsonl.gz results/
+"""
+import argparse
+import glob
+import gzip
+import heapq
+import json
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
+# Rotated file names: <stream>-<index>.jsonl.gz
+PART_PATTERN = re.compile(r"^(?P<stream>.+)-(?P<index>\d{5})\.jsonl\.gz$")
+
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class RotatingJsonlSink:
+    """
+    Append-only JSONL sink writing to rotating gzip files.
+    At most `buffer_records` records are held in memory before being compressed
+    to disk; a new file is started after `max_bytes` of uncompressed output.
+    Safe to use from several threads (e.g. as the target of a logging handler).
+    """
+
+    def __init__(self, directory: str, stream: str, worker: str = "",
+                 max_bytes: int = 64 * 1024 * 1024, buffer_records: int = 256):
+        """
+        Prepare the sink; the first file is created on the first flush.
+        :param directory: Directory for the output files (created if missing).
+        :param stream: Stream name used as file prefix (e.g. 'results-worker1').
+        :param worker: Worker id added to every record.
+        :param max_bytes: Uncompressed bytes per file before rotating.
+        :param buffer_records: Records buffered in memory between flushes.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.stream = stream
+        self.worker = worker
+        self.max_bytes = max_bytes
+        self.buffer_records = buffer_records
+        self._buffer: List[str] = []
+        self._lock = threading.Lock()
+        self._file: Optional[gzip.GzipFile] = None
+        self._index = 0
+        self._bytes = 0
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Queue a record; it is written to disk once the buffer is full.
+        :param record: JSON-serializable dictionary. 'ts' defaults to now.
+        """
+        record.setdefault("ts", time.time())
+        if self.worker:
+            record.setdefault("worker", self.worker)
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            if len(self._buffer) >= self.buffer_records:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Compress buffered records to disk and make them readable."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        """Write the buffer to the current file, rotating it when full. Caller holds the lock."""
+        if not self._buffer:
+            return
+        if self._file is None:
+            path = os.path.join(self.directory, f"{self.stream}-{self._index:05d}.jsonl.gz")
+            self._file = gzip.open(path, "wb")
+        data = "".join(self._buffer).encode("utf-8")
+        self._buffer.clear()
+        self._file.write(data)
+        # Sync flush so everything written so far can be read even if the run is killed
+        self._file.flush(zlib.Z_SYNC_FLUSH)
+        self._bytes += len(data)
+        if self._bytes >= self.max_bytes:
+            self._file.close()
+            self._file = None
+            self._index += 1
+            self._bytes = 0
+
+    def close(self) -> None:
+        """Flush remaining records and close the current file."""
+        with self._lock:
+            self._flush_locked()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class JsonlLogHandler(logging.Handler):
+    """
+    Logging handler that forwards log records to a RotatingJsonlSink.
+    """
+
+    def __init__(self, sink: RotatingJsonlSink, level: int = logging.NOTSET):
+        """
+        Initialize the handler.
+        :param sink: Sink receiving one record per log message.
+        :param level: Minimum level handled.
+        """
+        super().__init__(level)
+        self.sink = sink
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write the log record to the sink as a JSON object."""
+        try:
+            entry = {"ts": record.created, "type": "log", "logger": record.name,
+                     "level": record.levelname, "message": record.getMessage()}
+            if record.exc_info:
+                entry["exception"] = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            self.sink.write(entry)
+        except Exception:
+            self.handleError(record)
+
+
+def read_stream(paths: List[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Read the rotated parts of one stream in order, one record at a time.
+    A truncated last part (worker killed mid-run) is read up to the last flush.
+    :param paths: Part files of a single stream, sorted by index.
+    :return: Iterator over records.
+    """
+    for path in paths:
+        with gzip.open(path, "rt", encoding="utf-8") as part:
+            try:
+                for line in part:
+                    if line.endswith("\n"):
+                        yield json.loads(line)
+            except EOFError:
+                logging.getLogger("ResultSink").warning(f"Truncated stream part: {path}")
+
+
+def find_streams(inputs: List[str]) -> Dict[str, List[str]]:
+    """
+    Group part files by stream name.
+    :param inputs: Files or directories containing *.jsonl.gz parts.
+    :return: Stream name -> part paths sorted by index.
+    """
+    paths: List[str] = []
+    for item in inputs:
+        paths.extend(sorted(glob.glob(os.path.join(item, "*.jsonl.gz"))) if os.path.isdir(item) else [item])
+
+    streams: Dict[str, List[str]] = {}
+    for path in paths:
+        match = PART_PATTERN.match(os.path.basename(path))
+        stream = os.path.join(os.path.dirname(path), match.group("stream")) if match else path
+        streams.setdefault(stream, []).append(path)
+    for parts in streams.values():
+        parts.sort()
+    return streams
+
+
+def merge_streams(inputs: List[str], output: str) -> int:
+    """
+    K-way merge per-worker streams by timestamp into one file.
+    Only one record per stream is held in memory at a time.
+    :param inputs: Files or directories containing *.jsonl.gz parts.
+    :param output: Output path; gzip-compressed if it ends with '.gz'.
+    :return: Number of records written.
+    """
+    streams = find_streams(inputs)
+    merged = heapq.merge(*(read_stream(parts) for parts in streams.values()), key=lambda r: r.get("ts", 0))
+    opener = gzip.open if output.endswith(".gz") else open
+    count = 0
+    with opener(output, "wt", encoding="utf-8") as out:
+        for record in merged:
+            out.write(json.dumps(record, separators=(",", ":")) + "\n")
+            count += 1
+    return count
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Work with streamed result and log files.")
+    commands = parser.add_subparsers(dest="action", required=True)
+
+    merge = commands.add_parser("merge", help="Merge per-worker streams by timestamp")
+    merge.add_argument("output", help="Output file (.jsonl or .jsonl.gz)")
+    merge.add_argument("inputs", nargs="+", help="Stream files or directories")
+
+    args = parser.parse_args()
+    count = merge_streams(args.inputs, args.output)
+    print(f"Merged {count} records into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
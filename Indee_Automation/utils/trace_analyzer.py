@@ -0,0 +1,148 @@
+"""
+Offline analysis of WebDriver command traces recorded by utils.command_trace.
+
+Usage (from the Indee_Automation directory):
+    python -m utils.trace_analyzer summary traces/run.jsonl
+    python -m utils.trace_analyzer diff traces/before.jsonl traces/after.jsonl
+"""
+import argparse
+import math
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Tuple
+
+from utils.command_trace import command_key, read_trace
+
+# Commands that only look something up; repeating them with the same arguments is redundant
+LOOKUP_COMMANDS: Tuple[str, ...] = ("findElement", "findElements", "findChildElement", "findChildElements")
+
+# Upper bounds (ms) of the latency histogram buckets
+HISTOGRAM_BUCKETS: Tuple[float, ...] = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, math.inf)
+
+
+class TraceStats:
+    """
+    Aggregated statistics for one trace: command counts and latencies per
+    page-object method, repeated lookups and latency histograms per command.
+    """
+
+    def __init__(self, records: Iterable[Dict[str, Any]]):
+        """
+        Aggregate trace records in a single pass.
+        :param records: Iterable of trace records (see read_trace).
+        """
+        self.total_commands = 0
+        self.total_latency_ms = 0.0
+        self.calls_by_caller: Counter = Counter()
+        self.latency_by_caller: Dict[str, float] = defaultdict(float)
+        self.commands_by_caller: Dict[str, Counter] = defaultdict(Counter)
+        self.lookups: Dict[str, Counter] = defaultdict(Counter)
+        self.histograms: Dict[str, List[int]] = defaultdict(lambda: [0] * len(HISTOGRAM_BUCKETS))
+        self.errors: Counter = Counter()
+
+        for record in records:
+            caller, command, latency = record["caller"], record["command"], record["latency_ms"]
+            self.total_commands += 1
+            self.total_latency_ms += latency
+            self.calls_by_caller[caller] += 1
+            self.latency_by_caller[caller] += latency
+            self.commands_by_caller[caller][command] += 1
+            if command in LOOKUP_COMMANDS:
+                self.lookups[command_key(command, record["params"])][caller] += 1
+            bucket = next(i for i, bound in enumerate(HISTOGRAM_BUCKETS) if latency <= bound)
+            self.histograms[command][bucket] += 1
+            if record["status"] == "error":
+                self.errors[(caller, record.get("error", "unknown error"))] += 1
+
+    def redundant_lookups(self) -> List[Tuple[str, int, Counter]]:
+        """
+        Lookups issued more than once with identical arguments, e.g. the
+        'video_player' iframe that every VideoPage method finds again.
+        :return: List of (command key, count, callers), most repeated first.
+        """
+        repeated = [(key, sum(callers.values()), callers) for key, callers in self.lookups.items()]
+        return sorted((item for item in repeated if item[1] > 1), key=lambda item: -item[1])
+
+
+def _bucket_label(index: int) -> str:
+    """Return a printable label for a histogram bucket."""
+    low = 0 if index == 0 else HISTOGRAM_BUCKETS[index - 1]
+    high = HISTOGRAM_BUCKETS[index]
+    return f">{low:g}ms" if math.isinf(high) else f"{low:g}-{high:g}ms"
+
+
+def print_summary(stats: TraceStats, top: int = 10) -> None:
+    """
+    Print command counts per page-object method, redundant lookups and latency histograms.
+    :param stats: Aggregated trace statistics.
+    :param top: Number of redundant lookups to list.
+    """
+    print(f"Commands: {stats.total_commands}   total latency: {stats.total_latency_ms / 1000:.2f}s\n")
+
+    print("Commands per page-object method:")
+    for caller, count in stats.calls_by_caller.most_common():
+        breakdown = ", ".join(f"{cmd}={n}" for cmd, n in stats.commands_by_caller[caller].most_common())
+        print(f"  {caller:<40} {count:>6}  {stats.latency_by_caller[caller]:>10.1f}ms  ({breakdown})")
+
+    redundant = stats.redundant_lookups()
+    print(f"\nRedundant lookups ({len(redundant)}):")
+    for key, count, callers in redundant[:top]:
+        print(f"  {count:>4}x  {key}")
+        print(f"         from {', '.join(f'{caller} ({n})' for caller, n in callers.most_common())}")
+
+    print("\nLatency histograms:")
+    for command, buckets in sorted(stats.histograms.items()):
+        counts = "  ".join(f"{_bucket_label(i)}:{n}" for i, n in enumerate(buckets) if n)
+        print(f"  {command:<28} {counts}")
+
+    if stats.errors:
+        print("\nErrors:")
+        for (caller, error), count in stats.errors.most_common():
+            print(f"  {count:>4}x  {caller:<40} {error}")
+
+
+def print_diff(before: TraceStats, after: TraceStats) -> None:
+    """
+    Print per-method differences in command count and latency between two traces.
+    :param before: Statistics of the baseline trace.
+    :param after: Statistics of the trace being compared.
+    """
+    print(f"Commands: {before.total_commands} -> {after.total_commands} "
+          f"({after.total_commands - before.total_commands:+d})")
+    print(f"Latency:  {before.total_latency_ms:.1f}ms -> {after.total_latency_ms:.1f}ms "
+          f"({after.total_latency_ms - before.total_latency_ms:+.1f}ms)\n")
+
+    callers = sorted(set(before.calls_by_caller) | set(after.calls_by_caller))
+    print(f"  {'method':<40} {'commands':>16} {'latency (ms)':>26}")
+    for caller in callers:
+        n_before, n_after = before.calls_by_caller[caller], after.calls_by_caller[caller]
+        t_before, t_after = before.latency_by_caller.get(caller, 0.0), after.latency_by_caller.get(caller, 0.0)
+        if n_before == n_after and abs(t_after - t_before) < 0.05:
+            continue
+        print(f"  {caller:<40} {n_before:>5} -> {n_after:<5} ({n_after - n_before:+d})"
+              f" {t_before:>9.1f} -> {t_after:<9.1f} ({t_after - t_before:+.1f})")
+
+    print(f"\nRedundant lookups: {len(before.redundant_lookups())} -> {len(after.redundant_lookups())}")
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Analyze WebDriver command traces.")
+    commands = parser.add_subparsers(dest="action", required=True)
+
+    summary = commands.add_parser("summary", help="Summarize a single trace")
+    summary.add_argument("trace")
+    summary.add_argument("--top", type=int, default=10, help="Number of redundant lookups to show")
+
+    diff = commands.add_parser("diff", help="Compare two traces")
+    diff.add_argument("before")
+    diff.add_argument("after")
+
+    args = parser.parse_args()
+    if args.action == "summary":
+        print_summary(TraceStats(read_trace(args.trace)), top=args.top)
+    else:
+        print_diff(TraceStats(read_trace(args.before)), TraceStats(read_trace(args.after)))
+
+
+if __name__ == "__main__":
+    main()